@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Add category support for stock items to production-database.js.
+
+Consolidates the old add_category_carefully.py, add_category_support.py and
+update_stock_category.py scripts, which each re-read, re-scanned and rewrote
+the same file with ~90% overlapping substitutions. This driver runs the
+superset of their rewrites in one read, one substitution pass and one atomic
+write. The compiled patterns and rule tables live in
+category_migration_patterns.py.
+
+With --sql, applies the schema change directly in the database (PostgreSQL
+via DATABASE_URL, SQLite otherwise) instead of patching the JS source.
+"""
+import os
+import sys
+import tempfile
+
+from category_migration_patterns import (
+    COMBINED,
+    COUNTS,
+    HANDLERS,
+    LITERAL_SUBS,
+    MIGRATION_FUNC_TEMPLATE,
+    RULE_NAMES,
+)
+
+DB_PATH = 'production-database.js'
+
+
+def _sqlite_db_path():
+    # Mirrors the path resolution in production-database.js.
+    if os.environ.get('DATABASE_PATH'):
+        return os.environ['DATABASE_PATH'].replace('leads.db', 'production.db')
+    if os.environ.get('RAILWAY_VOLUME_MOUNT_PATH'):
+        return os.path.join(os.environ['RAILWAY_VOLUME_MOUNT_PATH'], 'production.db')
+    if os.environ.get('RAILWAY_ENVIRONMENT'):
+        return '/app/production.db'
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'production.db')
+
+
+def run_sql_migration():
+    """Add the category column directly in the database (--sql mode).
+
+    An ALTER TABLE is an O(1) catalog change, so when the schema is the only
+    thing missing this is far cheaper and safer than rewriting the JS source.
+    Uses DATABASE_URL for PostgreSQL (same as the app) and the app's SQLite
+    path logic otherwise.
+    """
+    database_url = os.environ.get('DATABASE_URL')
+    if database_url:
+        try:
+            import psycopg2
+        except ImportError:
+            print("   ERROR: psycopg2 is required for the PostgreSQL path")
+            return 1
+        conn = psycopg2.connect(database_url)
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute(
+                    'ALTER TABLE stock_items ADD COLUMN IF NOT EXISTS category VARCHAR(255)'
+                )
+        finally:
+            conn.close()
+        print('Added category column in PostgreSQL (or it already existed)')
+        return 0
+
+    import sqlite3
+    db_path = _sqlite_db_path()
+    if not os.path.exists(db_path):
+        print(f'   ERROR: SQLite database not found at {db_path}')
+        return 1
+    conn = sqlite3.connect(db_path)
+    try:
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(stock_items)')]
+        if not columns:
+            print('   ERROR: stock_items table not found')
+            return 1
+        if 'category' in columns:
+            print('Category column already present - nothing to do')
+            return 0
+        with conn:
+            conn.execute('ALTER TABLE stock_items ADD COLUMN category TEXT')
+    finally:
+        conn.close()
+    print(f'Added category column in {db_path}')
+    return 0
+
+
+def main(path=DB_PATH):
+    # Read the file. Several patterns span lines (the \s+ runs), so the file
+    # has to be processed as a whole; a 1 MB buffer keeps the read to a few
+    # syscalls.
+    with open(path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        content = f.read()
+
+    # Fast path: if the category columns are already in place, skip the regex
+    # pass and the rewrite entirely. A substring probe is one linear scan.
+    if 'category VARCHAR(255)' in content and 'category TEXT' in content:
+        print("Category support already present - nothing to do")
+        return 0
+
+    counts = dict(COUNTS)
+    matched = set()
+
+    def dispatch(m):
+        # Returns the replacement text for a match, or None to leave it alone.
+        literal = LITERAL_SUBS.get(m.group(0))
+        if literal is not None:
+            matched.add(m.group(0))
+            return literal
+        # m.lastgroup would report the innermost capture, so find the regex
+        # rule by its outer group instead.
+        for name in RULE_NAMES:
+            if m.group(name) is None:
+                continue
+            matched.add(name)
+            remaining = counts.get(name)
+            if remaining is not None:
+                if remaining == 0:
+                    return None
+                counts[name] = remaining - 1
+            if name == 'bom_func':
+                return MIGRATION_FUNC_TEMPLATE.format(indent=m.group('bom_ws')) + m.group(0)
+            return HANDLERS[name](m)
+        return None
+
+    print("Applying category substitutions in a single pass...")
+    # Collect every edit as (start, end, replacement) from one scan, then
+    # splice the result together with a single join: one pass over the text
+    # and one output allocation, instead of sub() growing its buffer as it
+    # copies.
+    edits = []
+    for m in COMBINED.finditer(content):
+        repl = dispatch(m)
+        if repl is not None:
+            edits.append((m.start(), m.end(), repl))
+
+    # Fail fast: a rule that matched nothing means the JS source has drifted
+    # from what the rewrites expect, and writing would leave the file in a
+    # half-migrated state. Abort before touching it.
+    missing = [name for name in RULE_NAMES if name not in matched]
+    missing += [key for key in LITERAL_SUBS if key not in matched]
+    if missing:
+        print("   ERROR: no match for:")
+        for item in missing:
+            print(f"      {item!r}")
+        print("   production-database.js left untouched")
+        return 1
+
+    out = []
+    prev = 0
+    for start, end, repl in edits:
+        out.append(content[prev:start])
+        out.append(repl)
+        prev = end
+    out.append(content[prev:])
+    content = ''.join(out)
+
+    # Write to a sibling temp file, fsync it, then swap it in atomically.
+    # A crash mid-write can never leave a half-written file behind, and the
+    # rename only happens once the data is on disk - no defensive backup copy
+    # needed. The 1 MB buffer keeps the multi-MB write to a few syscalls
+    # instead of 8 KiB default-buffer chunks.
+    tmp = tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', buffering=1 << 20,
+        dir=os.path.dirname(path) or '.',
+        prefix=os.path.basename(path) + '.', delete=False
+    )
+    with tmp as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp.name, path)
+
+    print("\n✓ All steps completed!")
+    print("Please run: node -c production-database.js to verify syntax")
+    return 0
+
+
+if __name__ == '__main__':
+    if '--sql' in sys.argv[1:]:
+        sys.exit(run_sql_migration())
+    sys.exit(main())
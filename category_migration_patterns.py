@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Compiled patterns and rewrite rules for the stock_items category migration.
+
+Everything here is compiled once at import and shared by whichever entry
+point (apply_category_migration.py or the add_category_carefully.py wrapper)
+pulls it in, so repeated invocations inside one process never recompile.
+"""
+try:
+    # Drop-in replacement for re: guaranteed-linear matching on these
+    # patterns and the GIL released during C-level scans.
+    import regex as re
+except ImportError:
+    import re
+
+MIGRATION_FUNC_TEMPLATE = '''{indent}static async ensureStockItemsSchema() {{
+{indent}    if (!isPostgreSQL) return;
+{indent}
+{indent}    try {{
+{indent}        await pool.query(`
+{indent}            DO $$
+{indent}            BEGIN
+{indent}                IF EXISTS (
+{indent}                    SELECT 1 FROM information_schema.tables
+{indent}                    WHERE table_schema = 'public' AND table_name='stock_items'
+{indent}                ) AND NOT EXISTS (
+{indent}                    SELECT 1 FROM information_schema.columns
+{indent}                    WHERE table_schema = 'public' AND table_name='stock_items' AND column_name='category'
+{indent}                ) THEN
+{indent}                    ALTER TABLE stock_items ADD COLUMN category VARCHAR(255);
+{indent}                END IF;
+{indent}            END $$;
+{indent}        `);
+{indent}    }} catch (error) {{
+{indent}        console.error('Error ensuring stock_items schema:', error);
+{indent}    }}
+{indent}}}
+
+'''
+
+# Literal token rewrites: matched text maps straight to its replacement, so
+# dispatch is one dict lookup, no per-rule probing. (The longer patterns the
+# old update_stock_category.py carried are subsumed by the shorter prefix
+# keys here, which produce the same output.)
+LITERAL_SUBS = {
+    'INSERT INTO stock_items (name, description, unit,':
+        'INSERT INTO stock_items (name, description, category, unit,',
+    'VALUES ($1, $2, $3, $4, $5, $6, $7) RETURNING':
+        'VALUES ($1, $2, $3, $4, $5, $6, $7, $8) RETURNING',
+    'VALUES (?, ?, ?, ?, ?, ?, ?)':
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+    '[data.name, data.description, data.unit,':
+        '[data.name, data.description, data.category || null, data.unit,',
+    '.run(data.name, data.description, data.unit,':
+        '.run(data.name, data.description, data.category || null, data.unit,',
+    'UPDATE stock_items SET name = $1, description = $2, unit = $3,':
+        'UPDATE stock_items SET name = $1, description = $2, category = $3, unit = $4,',
+    'UPDATE stock_items SET name = ?, description = ?, unit = ?,':
+        'UPDATE stock_items SET name = ?, description = ?, category = ?, unit = ?,',
+    'static async createStockItem(data) {':
+        'static async createStockItem(data) {\n        await this.ensureStockItemsSchema();',
+    'static async updateStockItem(id, data) {':
+        'static async updateStockItem(id, data) {\n        await this.ensureStockItemsSchema();',
+}
+
+# Rules that genuinely need \s+ or captured groups. Each gets a named group
+# in the combined pattern; dispatch falls back to these when the matched text
+# is not a literal key.
+REGEX_RULES = [
+    ('sq_desc',
+     r'(?P<sq_pre>description TEXT,\s+)(?P<sq_unit>unit TEXT NOT NULL,)',
+     lambda m: m.group('sq_pre') + 'category TEXT,\n            ' + m.group('sq_unit')),
+    ('pg_desc',
+     r'(?P<pg_pre>description TEXT,\s+)(?P<pg_unit>unit VARCHAR\(50\) NOT NULL,)',
+     lambda m: m.group('pg_pre') + 'category VARCHAR(255),\n                ' + m.group('pg_unit')),
+    ('bom_func',
+     r'(?P<bom_ws>\s+)static async ensureBOMItemsSchema\(\)',
+     None),  # handled specially in the driver's dispatch closure
+    ('pg_update_where',
+     r'min_quantity = \$4, location = \$5, cost_per_unit_gbp = \$6\s+WHERE id = \$7',
+     lambda m: 'min_quantity = $5, location = $6, cost_per_unit_gbp = $7\n                   WHERE id = $8'),
+]
+
+# The CREATE TABLE splices and the migration-function insertion are limited
+# to one occurrence, matching the count=1 / search-once semantics of the old
+# sequential scripts.
+COUNTS = {'sq_desc': 1, 'pg_desc': 1, 'bom_func': 1}
+
+# Everything is merged into one alternation so the whole file is scanned
+# once instead of once per substitution.
+COMBINED = re.compile('|'.join(
+    [f'(?P<{name}>{pattern})' for name, pattern, _ in REGEX_RULES]
+    + [re.escape(literal) for literal in LITERAL_SUBS]
+))
+HANDLERS = {name: handler for name, _, handler in REGEX_RULES}
+RULE_NAMES = [name for name, _, _ in REGEX_RULES]